@@ -38,12 +38,19 @@ def main():
         
         with st.spinner("Hybrid verification in progress: Searching live sources + AI analysis..."):
             result = verifier.verify_news(news_text)
+        st.session_state['last_result'] = result
         
         EnhancedUI.render_enhanced_results(result, news_text)
     
     elif verify_clicked and not news_text.strip():
         st.warning("Please enter some news text to verify.")
     
+    elif st.session_state.get('last_result') is not None:
+        # Widget reruns inside the results (e.g. "Load more") keep showing the last verification
+        EnhancedUI.render_enhanced_results(
+            st.session_state['last_result'], st.session_state.get('last_query', '')
+        )
+    
     # Clean footer
     st.markdown("---")
     footer_html = dedent(f"""
@@ -1,6 +1,6 @@
 """Core verification logic for Bharat Fact application."""
 
-from .verifier import HybridNewsVerifier
+from .verifier import HybridNewsVerifier, VerificationResult
 
-__all__ = ['HybridNewsVerifier']
+__all__ = ['HybridNewsVerifier', 'VerificationResult']
 
@@ -30,8 +30,8 @@ def create_hybrid_prompt(news_claim: str, live_evidence: list, include_evidence_
         tagging_instruction = f"""
 
 EVIDENCE CLASSIFICATION (include this in your response):
-After your main analysis, classify each evidence article as supportive, contradictory, or irrelevant.
-Return a JSON array like: [{{"index":1,"tag":"supportive","rationale":"brief reason"}}, ...]
+Also include "evidence_tags": classify each evidence article as supportive, contradictory, or irrelevant,
+one entry per article like: {{"index":1,"tag":"supportive","rationale":"brief reason"}}
 {evidence_list_for_tagging}
 """
     
@@ -54,10 +54,11 @@ ANALYSIS INSTRUCTIONS:
 4. Note if evidence is recent or outdated
 5. Identify any missing context or conflicting reports
 
-Please provide analysis in this EXACT format:
+Respond with a single JSON object with EXACTLY these fields:
 
-VERIFICATION_STATUS: [TRUE/FALSE/PARTIALLY_TRUE/MISLEADING/UNVERIFIED]
-CONFIDENCE_SCORE: [0-100]
+"verification_status": one of TRUE, FALSE, PARTIALLY_TRUE, MISLEADING, UNVERIFIED
+"confidence_score": integer from 0 to 100
+"analysis": plain text using these section headings, each on its own line:
 
 EVIDENCE_BASED_ANALYSIS:
 [Analyze how the live evidence relates to the claim. Which sources support/contradict?]
@@ -1,6 +1,6 @@
 """Data fetching modules for Bharat Fact application."""
 
-from .news_fetcher import LiveNewsFetcher
+from .news_fetcher import Article, LiveNewsFetcher, get_news_fetcher
 
-__all__ = ['LiveNewsFetcher']
+__all__ = ['Article', 'LiveNewsFetcher', 'get_news_fetcher']
 
@@ -1,50 +1,170 @@
 """News fetching functionality from various APIs."""
 
 import json
+import threading
+from itertools import islice
+from urllib.parse import quote_plus, urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from utils.config import EnhancedAppConfig
 from utils.helpers import safe_requests_get
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:
+    add_script_run_ctx = get_script_run_ctx = None
+
+SOURCE_FETCH_TIMEOUT = 20  # Seconds to wait for all sources combined
+MAX_RESPONSE_BYTES = 2_000_000  # Cap on API response bodies
+MAX_RSS_VALIDATORS = 256  # RSS feeds remembered for conditional GETs
+
+
+class Article(NamedTuple):
+    """A news article as returned by the fetchers."""
+    title: str
+    link: str
+    published: str
+    source: str
+    api: str
+
+
+def _build_session() -> requests.Session:
+    """HTTP session with keep-alive connection pooling and light retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session so repeat calls to NewsAPI/GDELT reuse warm TLS connections
+_SESSION = _build_session()
+
+# Google News RSS search restricted to trusted Indian outlets
+_TRUSTED_HOSTS = frozenset({
+    "ndtv.com", "thehindu.com", "indiatoday.in", "indiatimes.com",
+    "indianexpress.com", "boomlive.in", "altnews.in", "thequint.com",
+    "firstpost.com", "news18.com", "republicworld.com"
+})
+_RSS_URL_TEMPLATE = "https://news.google.com/rss/search?q={q}&hl=en-IN&gl=IN&ceid=IN:en"
+
+# RSS parser: no entity expansion or network access for untrusted feeds
+_RSS_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, recover=True)
+
+
+def _attach_script_ctx(ctx) -> None:
+    """Thread initializer: let worker threads use st.* with the caller's context."""
+    if ctx is not None and add_script_run_ctx is not None:
+        add_script_run_ctx(threading.current_thread(), ctx)
+
+
+# Query parameters that only track referrals and never identify an article
+_TRACKING_PARAM_PREFIXES = ("utm_", "fbclid=", "gclid=")
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Deduplication key for an article URL: scheme-less, lowercase host,
+    no fragment, no tracking parameters, no trailing slash.
+    """
+    parts = urlsplit(url)
+    query = "&".join(
+        p for p in parts.query.split("&")
+        if p and not p.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    )
+    key = parts.netloc.lower() + parts.path.rstrip("/")
+    return f"{key}?{query}" if query else key
+
+
+def _is_trusted_url(url: str) -> bool:
+    """Whether the URL's host is a trusted site or one of its subdomains."""
+    host = (urlsplit(url).hostname or "").lower()
+    while host:
+        if host in _TRUSTED_HOSTS:
+            return True
+        _, _, host = host.partition(".")
+    return False
+
+
+def _read_capped(resp) -> bytes:
+    """Read a streamed response body, stopping at MAX_RESPONSE_BYTES."""
+    return resp.raw.read(MAX_RESPONSE_BYTES, decode_content=True) or b""
+
+
+@st.cache_resource(show_spinner=False)
+def _rss_validator_store() -> Dict[Tuple[str, int], Tuple[Optional[str], Optional[str], Tuple[Article, ...]]]:
+    """(ETag, Last-Modified, articles) of the last 200 response per RSS request."""
+    return {}
+
 
 @st.cache_data(ttl=1800, show_spinner=False)
-def cached_fetch_google_news_rss(query: str, max_results: int = 8) -> List[Dict[str, Any]]:
+def cached_fetch_google_news_rss(query: str, max_results: int = 8) -> List[Article]:
     """Fetch news from Google News RSS feed."""
     results = []
     try:
         if not query or not query.strip():
             return results
-        q = query.strip().replace(" ", "+")
-        trusted_sites = [
-            "ndtv.com", "thehindu.com", "indiatoday.in", "indiatimes.com",
-            "indianexpress.com", "boomlive.in", "altnews.in", "thequint.com",
-            "firstpost.com", "news18.com", "republicworld.com"
-        ]
-        site_part = "+OR+".join([f"site:{s}" for s in trusted_sites])
-        rss_url = f"https://news.google.com/rss/search?q={q}+({site_part})&hl=en-IN&gl=IN&ceid=IN:en"
-        resp = safe_requests_get(rss_url, timeout=10)
+        q = quote_plus(query.strip())
+        rss_url = _RSS_URL_TEMPLATE.format(q=q)
+
+        # Conditional GET: an unchanged feed answers 304 and is not re-parsed
+        store = _rss_validator_store()
+        store_key = (rss_url, max_results)
+        previous = store.get(store_key)
+        headers = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64)'}
+        if previous:
+            etag, last_modified, _ = previous
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        resp = safe_requests_get(rss_url, headers=headers, timeout=10)
         if resp is None:
             return []
-        soup = BeautifulSoup(resp.content, "xml")
-        items = soup.find_all("item")[:max_results]
-        for item in items:
-            title = item.title.text if item.title else ""
-            link = item.link.text if item.link else ""
-            pub = item.pubDate.text if item.pubDate else ""
-            source = item.source.text if item.source else ""
-            if title and link:
-                results.append({
-                    "title": title.strip(),
-                    "link": link.strip(),
-                    "published": pub,
-                    "source": source,
-                    "api": "Google News RSS"
-                })
+        if resp.status_code == 304 and previous:
+            return list(previous[2])
+
+        root = etree.fromstring(resp.content, parser=_RSS_PARSER)
+        if root is None:
+            return []
+        # Item links are news.google.com redirects; the publisher is on <source url="...">
+        for item in root.iterfind(".//item"):
+            title = item.findtext("title") or ""
+            link = item.findtext("link") or ""
+            source_el = item.find("source")
+            publisher_url = source_el.get("url", "") if source_el is not None else link
+            if not (title and link and _is_trusted_url(publisher_url)):
+                continue
+            pub = item.findtext("pubDate") or ""
+            source = (source_el.text or "") if source_el is not None else ""
+            results.append(Article(title.strip(), link.strip(), pub, source, "Google News RSS"))
+            if len(results) >= max_results:
+                break
+
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        if etag or last_modified:
+            if store_key not in store and len(store) >= MAX_RSS_VALIDATORS:
+                store.pop(next(iter(store)), None)
+            store[store_key] = (etag, last_modified, tuple(results))
     except Exception as e:
         st.warning(f"Google News RSS fetch failed: {e}")
         return []
@@ -52,7 +172,7 @@ def cached_fetch_google_news_rss(query: str, max_results: int = 8) -> List[Dict[
 
 
 @st.cache_data(ttl=1800, show_spinner=False)
-def cached_fetch_newsapi(query: str, newsapi_key: str, max_results: int = 8) -> List[Dict[str, Any]]:
+def cached_fetch_newsapi(query: str, newsapi_key: str, max_results: int = 8) -> List[Article]:
     """Fetch news from NewsAPI."""
     results = []
     if not newsapi_key:
@@ -70,34 +190,35 @@ def cached_fetch_newsapi(query: str, newsapi_key: str, max_results: int = 8) ->
             'from': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
         }
         headers = {"User-Agent": "BharatFact/3.0"}
-        resp = requests.get(url, params=params, headers=headers, timeout=12)
-        if resp.status_code != 200:
-            # Log error details for debugging
-            if resp.status_code == 401:
-                st.warning("NewsAPI: Invalid API key")
-            elif resp.status_code == 429:
-                st.warning("NewsAPI: Rate limit exceeded")
-            else:
-                st.warning(f"NewsAPI: HTTP {resp.status_code}")
-            return []
+        with _SESSION.get(url, params=params, headers=headers, timeout=12, stream=True) as resp:
+            if resp.status_code != 200:
+                # Log error details for debugging
+                if resp.status_code == 401:
+                    st.warning("NewsAPI: Invalid API key")
+                elif resp.status_code == 429:
+                    st.warning("NewsAPI: Rate limit exceeded")
+                else:
+                    st.warning(f"NewsAPI: HTTP {resp.status_code}")
+                return []
+            body = _read_capped(resp)
         # Check if response has content before parsing JSON
-        if not resp.text or not resp.text.strip():
+        if not body.strip():
             return []
         try:
-            data = resp.json()
-        except json.JSONDecodeError:
+            data = _json_loads(body)
+        except ValueError:
             st.warning(f"NewsAPI: Invalid JSON response")
             return []
-        articles = data.get('articles', [])[:max_results]
-        for article in articles:
+        # Project only the fields we keep; the rest of each article is never copied
+        for article in islice(data.get('articles') or (), max_results):
             if article.get('title') and article.get('url'):
-                results.append({
-                    "title": article['title'],
-                    "link": article['url'],
-                    "published": article.get('publishedAt', ''),
-                    "source": article.get('source', {}).get('name', ''),
-                    "api": "NewsAPI"
-                })
+                results.append(Article(
+                    article['title'],
+                    article['url'],
+                    article.get('publishedAt', ''),
+                    article.get('source', {}).get('name', ''),
+                    "NewsAPI"
+                ))
     except Exception as e:
         # Suppress common JSON parsing errors (usually means empty/invalid API response)
         error_str = str(e)
@@ -109,7 +230,7 @@ def cached_fetch_newsapi(query: str, newsapi_key: str, max_results: int = 8) ->
 
 
 @st.cache_data(ttl=1800, show_spinner=False)
-def cached_fetch_gdelt(query: str, max_results: int = 6) -> List[Dict[str, Any]]:
+def cached_fetch_gdelt(query: str, max_results: int = 6) -> List[Article]:
     """Fetch news from GDELT API."""
     results = []
     try:
@@ -122,19 +243,19 @@ def cached_fetch_gdelt(query: str, max_results: int = 6) -> List[Dict[str, Any]]
             'format': 'json',
             'maxrecords': max_results
         }
-        resp = requests.get(gdelt_url, params=params, timeout=15)
-        if resp.status_code != 200:
-            return []
-        data = resp.json()
-        articles = data.get('articles', [])[:max_results]
-        for article in articles:
-            results.append({
-                "title": article.get('title', ''),
-                "link": article.get('url', ''),
-                "published": article.get('seendate', ''),
-                "source": article.get('domain', ''),
-                "api": "GDELT"
-            })
+        with _SESSION.get(gdelt_url, params=params, timeout=15, stream=True) as resp:
+            if resp.status_code != 200:
+                return []
+            body = _read_capped(resp)
+        data = _json_loads(body)
+        for article in islice(data.get('articles') or (), max_results):
+            results.append(Article(
+                article.get('title', ''),
+                article.get('url', ''),
+                article.get('seendate', ''),
+                article.get('domain', ''),
+                "GDELT"
+            ))
     except Exception as e:
         st.warning(f"GDELT fetch failed: {e}")
         return []
@@ -160,38 +281,60 @@ class LiveNewsFetcher:
         return cached_fetch_gdelt(query, max_results=max_results)
     
     def fetch_all_news_sources(self, query: str, max_total: int = 15):
-        """Fetch from all available news sources and deduplicate."""
+        """Fetch from all available news sources concurrently and deduplicate."""
         if not query or not query.strip():
             return []
         with st.spinner("Searching live news sources..."):
-            all_results = []
-            google_results = []
-            try:
-                google_results = self.fetch_google_news_rss(query, max_results=8) or []
-            except Exception:
-                google_results = []
-            all_results.extend(google_results)
+            fetches = [(self.fetch_google_news_rss, 8)]
             if self.newsapi_key:
+                fetches.append((self.fetch_newsapi, 6))
+            fetches.append((self.fetch_gdelt, 4))
+
+            results_by_source = [[] for _ in fetches]
+            ctx = get_script_run_ctx() if get_script_run_ctx is not None else None
+            executor = ThreadPoolExecutor(
+                max_workers=len(fetches),
+                initializer=_attach_script_ctx,
+                initargs=(ctx,)
+            )
+            try:
+                futures = {
+                    executor.submit(fetch, query, max_results=max_results): i
+                    for i, (fetch, max_results) in enumerate(fetches)
+                }
                 try:
-                    newsapi_results = self.fetch_newsapi(query, max_results=6) or []
-                    all_results.extend(newsapi_results)
-                except Exception:
+                    for future in as_completed(futures, timeout=SOURCE_FETCH_TIMEOUT):
+                        try:
+                            results_by_source[futures[future]] = future.result() or []
+                        except Exception:
+                            pass
+                except FuturesTimeoutError:
+                    # Use whatever finished in time
                     pass
-            try:
-                gdelt_results = self.fetch_gdelt(query, max_results=4) or []
-                all_results.extend(gdelt_results)
-            except Exception:
-                pass
+            finally:
+                executor.shutdown(wait=False)
 
-        # Deduplicate by link
+            # Merge in fixed source order so deduplication prefers the same sources
+            all_results = [r for results in results_by_source for r in results]
+
+        # Deduplicate by canonical link
         seen = set()
         unique = []
         for r in all_results:
-            link = (r.get('link') or '').strip()
+            link = (r.link or '').strip()
             if not link:
                 continue
-            if link not in seen:
-                seen.add(link)
+            key = _canonical_url(link)
+            if key not in seen:
+                seen.add(key)
                 unique.append(r)
-        return unique[:max_total]
+                if len(unique) >= max_total:
+                    break
+        # Plain dicts at the boundary: prompts, UI and the JSON cache use them
+        return [r._asdict() for r in unique]
+
 
+@st.cache_resource(show_spinner=False)
+def get_news_fetcher() -> LiveNewsFetcher:
+    """Process-wide LiveNewsFetcher shared across sessions and reruns."""
+    return LiveNewsFetcher()
@@ -1,15 +1,349 @@
 """Layout components: header, sidebar, and forms."""
 
+import hashlib
 import re
-from textwrap import dedent
+from functools import lru_cache
 
 import streamlit as st
 import streamlit.components.v1 as components
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 
 from utils.config import EnhancedAppConfig
+from utils.caching import load_url_text, save_url_text
 from utils.helpers import safe_requests_get
 
+_URL_RE = re.compile(r'^https?://', re.IGNORECASE)
+# Only <p> and <meta> are built by the bs4 fallback; scripts/styles are never parsed
+_ARTICLE_STRAINER = SoupStrainer(["p", "meta"])
+
+# Professional, clean styling (static; built once at import)
+_CUSTOM_CSS = """
+<style>
+:root {
+    --fg: #CBD5E0;
+    --fg-strong: #E2E8F0;
+    --primary: #2C5282;
+    --border: rgba(226, 232, 240, 0.5);
+}
+
+#MainMenu, footer, header {visibility: hidden;}
+
+/* Main container styling */
+.main .block-container {
+    padding: 1rem 3rem;
+    max-width: 1400px;
+}
+
+@media (max-width: 768px) {
+    .main .block-container {
+        padding-left: 1rem;
+        padding-right: 1rem;
+    }
+}
+
+/* Readable text on dark background */
+h1, h2, h3 {
+    color: var(--fg-strong);
+    font-weight: 600;
+}
+
+.stMarkdown, p, label, div {
+    color: var(--fg);
+}
+
+label {
+    font-weight: 600;
+    font-size: 0.95rem;
+}
+
+/* Button styling */
+.stButton > button {
+    border-radius: 8px;
+    font-weight: 600;
+    transition: all 0.3s ease;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    padding: 0.5rem 1.5rem;
+    font-size: 1rem;
+}
+
+.stButton > button:hover {
+    transform: translateY(-1px);
+    box-shadow: 0 4px 8px rgba(0,0,0,0.15);
+}
+
+.stButton > button[kind="primary"] {
+    background: linear-gradient(135deg, var(--primary) 0%, #1E3A5F 100%);
+    border: none;
+}
+
+/* Input styling */
+.stTextInput > div > div > input,
+.stTextArea > div > div > textarea {
+    border-radius: 8px;
+    border: 2px solid var(--border);
+    transition: all 0.3s ease;
+    background-color: transparent;
+    font-size: 0.95rem;
+}
+
+.stTextInput > div > div > input:focus,
+.stTextArea > div > div > textarea:focus {
+    border-color: var(--primary);
+    box-shadow: 0 0 0 3px rgba(44, 82, 130, 0.1);
+    outline: none;
+}
+
+/* Radio button styling */
+.stRadio > div {
+    background-color: transparent;
+    padding: 14px 16px;
+    border-radius: 8px;
+    border: 2px solid var(--border);
+    transition: all 0.3s ease;
+}
+
+.stRadio > div:hover {
+    border-color: rgba(203, 213, 224, 0.7);
+    background-color: rgba(247, 250, 252, 0.3);
+}
+
+[data-testid="stMetricValue"] {
+    font-size: 1.8rem;
+}
+
+.element-container {
+    margin-bottom: 1rem;
+}
+
+/* Card-like container for form */
+.form-container {
+    background: transparent;
+    padding: 2rem;
+    border-radius: 12px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07), 0 1px 3px rgba(0, 0, 0, 0.06);
+    border: 1px solid rgba(226, 232, 240, 0.3);
+}
+
+.stApp {
+    background: var(--background-color, #0E1117);
+}
+</style>
+""".lstrip()
+
+
+# Wrapper aligning the form with the header container
+_FORM_WRAPPER_HTML = """
+<div style="
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 0 4rem;
+">
+""".lstrip()
+
+# Accent bar + label shown above each form input
+_SECTION_LABEL_TEMPLATE = """
+<div style="
+    display: flex;
+    align-items: center;
+    margin-bottom: {margin_bottom};
+    margin-top: {margin_top};
+">
+    <div style="
+        width: 5px;
+        height: 28px;
+        background: linear-gradient(180deg, {primary} 0%, {secondary} 100%);
+        border-radius: 3px;
+        margin-right: 1rem;
+        box-shadow: 0 2px 6px rgba(44, 82, 130, 0.3);
+    "></div>
+    <strong style="color: #E2E8F0; font-size: 1.2rem; font-weight: 600;">{label}</strong>
+</div>
+""".lstrip()
+
+# Header markup; colors and title are filled in with str.format
+_HEADER_TEMPLATE = """
+<div style="
+    max-width: 1200px;
+    margin: 0 auto 2rem auto;
+    padding: 3.5rem 4rem 3rem 4rem;
+    background: linear-gradient(135deg, rgba(15, 23, 42, 0.8) 0%, rgba(30, 41, 59, 0.6) 100%);
+    border-radius: 24px;
+    box-shadow: 0 12px 40px rgba(0, 0, 0, 0.15), 0 4px 12px rgba(0, 0, 0, 0.1), inset 0 1px 0 rgba(255, 255, 255, 0.05);
+    border: 1px solid rgba(226, 232, 240, 0.15);
+    backdrop-filter: blur(20px);
+    position: relative;
+    overflow: visible;
+">
+    <!-- Subtle background pattern -->
+    <div style="
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: radial-gradient(circle at 20% 50%, rgba(44, 82, 130, 0.1) 0%, transparent 50%),
+                    radial-gradient(circle at 80% 80%, rgba(30, 58, 95, 0.1) 0%, transparent 50%);
+        pointer-events: none;
+    "></div>
+    
+    <!-- Content wrapper -->
+    <div style="position: relative; z-index: 1;">
+        <!-- Top accent line -->
+        <div style="
+            width: 100px;
+            height: 5px;
+            background: linear-gradient(90deg, {primary} 0%, {secondary} 100%);
+            border-radius: 3px;
+            margin: 0 auto 2.5rem auto;
+            box-shadow: 0 2px 8px rgba(44, 82, 130, 0.4);
+        "></div>
+        
+        <!-- Header Section -->
+        <div style="text-align: center; padding-bottom: 0.5rem;">
+            <h1 style="
+                background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
+                -webkit-background-clip: text;
+                -webkit-text-fill-color: transparent;
+                background-clip: text;
+                font-size: 3.8rem;
+                margin: 0 0 1rem 0;
+                font-weight: 800;
+                line-height: 1.1;
+                letter-spacing: -0.06em;
+            ">{title}</h1>
+
+            <p style="
+                color: {text_light};
+                font-size: 1.3rem;
+                margin: 0;
+                font-weight: 400;
+                letter-spacing: 0.03em;
+                opacity: 0.85;
+            ">AI-Powered News Verification Platform</p>
+        </div>
+    </div>
+</div>
+""".lstrip()
+
+
+@lru_cache(maxsize=8)
+def _build_header_html(primary: str, secondary: str, text_light: str, title: str) -> str:
+    """Header HTML for a color scheme and title, formatted once per process."""
+    return _HEADER_TEMPLATE.format(
+        primary=primary,
+        secondary=secondary,
+        text_light=text_light,
+        title=title
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_input_section_header(primary: str, secondary: str, label: str,
+                                margin_bottom: str = "0.8rem", margin_top: str = "1rem") -> str:
+    """Accent-bar label HTML shown above a form input, formatted once per label."""
+    return _SECTION_LABEL_TEMPLATE.format(
+        primary=primary,
+        secondary=secondary,
+        margin_bottom=margin_bottom,
+        margin_top=margin_top,
+        label=label
+    )
+
+
+def _join_capped(texts, max_chars: int) -> str:
+    """Join non-empty texts with spaces, stopping once max_chars is reached."""
+    parts, total = [], 0
+    for t in texts:
+        t = t.strip()
+        if not t:
+            continue
+        parts.append(t)
+        total += len(t) + 1
+        if total >= max_chars:
+            break
+    return ' '.join(parts)
+
+
+def _extract_paragraphs_selectolax(content: bytes, max_chars: int) -> str:
+    """Article text from HTML via selectolax (C parser): <p> text, else meta description."""
+    tree = HTMLParser(content)
+    for node in tree.css("script, style, noscript"):
+        node.decompose()
+    extracted = _join_capped((p.text() for p in tree.css('p')), max_chars)
+    if not extracted:
+        meta = tree.css_first('meta[name="description"]') or tree.css_first('meta[property="og:description"]')
+        content_attr = meta.attributes.get('content') if meta else None
+        if content_attr:
+            extracted = content_attr.strip()
+    return extracted
+
+
+@lru_cache(maxsize=1)
+def _newspaper_article_cls():
+    """newspaper3k's Article class, imported on first use (None if not installed)."""
+    # Deferred: newspaper pulls in nltk, PIL and more, which most runs never need
+    try:
+        from newspaper import Article
+    except ImportError:
+        return None
+    return Article
+
+
+def _extract_paragraphs_bs4(content: bytes, max_chars: int) -> str:
+    """Article text from HTML via BeautifulSoup: <p> text, else meta description."""
+    soup = BeautifulSoup(content, 'lxml', parse_only=_ARTICLE_STRAINER)
+    extracted = _join_capped((p.get_text() for p in soup.find_all('p')), max_chars)
+    if not extracted:
+        meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+        if meta and meta.get('content'):
+            extracted = meta.get('content').strip()
+    return extracted
+
+
+def _fetch_article_text(url: str, max_chars: int) -> str:
+    """Extract text from URL via selectolax/BeautifulSoup; fall back to newspaper3k if that finds nothing."""
+    extracted = ""
+    try:
+        headers = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64)'}
+        resp = safe_requests_get(url, headers=headers, timeout=8)
+        if resp and 'text/html' in resp.headers.get('Content-Type', ''):
+            if HTMLParser is not None:
+                extracted = _extract_paragraphs_selectolax(resp.content, max_chars)
+            else:
+                extracted = _extract_paragraphs_bs4(resp.content, max_chars)
+    except Exception:
+        extracted = ""
+    if extracted:
+        return extracted[:max_chars].strip()
+
+    # newspaper3k does its own download + NLP setup, so only pay for it when the fast path fails
+    article_cls = _newspaper_article_cls()
+    if article_cls is None:
+        return ""
+    try:
+        a = article_cls(url)
+        a.download()
+        a.parse()
+        return (a.text or "").strip()[:max_chars]
+    except Exception:
+        return ""
+
+
+@st.cache_data(show_spinner=False)
+def _cached_article_text(url_key: str, _url: str, max_chars: int) -> str:
+    """Article text for a URL; cache keyed on its short digest rather than the raw URL."""
+    text = load_url_text(_url, max_chars)
+    if not text:
+        text = _fetch_article_text(_url, max_chars)
+        if text:
+            save_url_text(_url, max_chars, text)
+    return text
+
 
 class BeautifulUI:
     """UI components for layout and forms."""
@@ -27,134 +361,7 @@ class BeautifulUI:
         except Exception:
             pass
         
-        # Professional, clean styling
-        custom_css = dedent("""
-        <style>
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        
-        /* Main container styling */
-        .main .block-container {
-            padding-top: 1rem;
-            padding-bottom: 1rem;
-            max-width: 1400px;
-            padding-left: 3rem;
-            padding-right: 3rem;
-        }
-        
-        @media (max-width: 768px) {
-            .main .block-container {
-                padding-left: 1rem;
-                padding-right: 1rem;
-            }
-        }
-        
-        /* Text styling - adaptive colors */
-        h1, h2, h3 {
-            color: #E2E8F0;
-            font-weight: 600;
-        }
-        
-        /* Ensure readable text on dark background */
-        .stMarkdown, p, label, div {
-            color: #CBD5E0;
-        }
-        
-        /* Button styling - enhanced */
-        .stButton > button {
-            border-radius: 8px;
-            font-weight: 600;
-            transition: all 0.3s ease;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            padding: 0.5rem 1.5rem;
-            font-size: 1rem;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }
-        
-        /* Primary button special styling */
-        .stButton > button[kind="primary"] {
-            background: linear-gradient(135deg, #2C5282 0%, #1E3A5F 100%);
-            border: none;
-        }
-        
-        /* Input styling - enhanced */
-        .stTextInput > div > div > input,
-        .stTextArea > div > div > textarea {
-            border-radius: 8px;
-            border: 2px solid rgba(226, 232, 240, 0.5);
-            transition: all 0.3s ease;
-            background-color: transparent;
-            font-size: 0.95rem;
-        }
-        
-        .stTextInput > div > div > input:focus,
-        .stTextArea > div > div > textarea:focus {
-            border-color: #2C5282;
-            box-shadow: 0 0 0 3px rgba(44, 82, 130, 0.1);
-            outline: none;
-        }
-        
-        /* Radio button styling */
-        .stRadio > div {
-            background-color: transparent;
-            padding: 14px 16px;
-            border-radius: 8px;
-            border: 2px solid rgba(226, 232, 240, 0.5);
-            transition: all 0.3s ease;
-        }
-        
-        .stRadio > div:hover {
-            border-color: rgba(203, 213, 224, 0.7);
-            background-color: rgba(247, 250, 252, 0.3);
-        }
-        
-        /* Label styling */
-        label {
-            font-weight: 600;
-            color: #2D3748;
-            font-size: 0.95rem;
-        }
-        
-        /* Metric cards */
-        [data-testid="stMetricValue"] {
-            font-size: 1.8rem;
-        }
-        
-        /* Spacing */
-        .element-container {
-            margin-bottom: 1rem;
-        }
-        
-        /* Card-like container for form */
-        .form-container {
-            background: transparent;
-            padding: 2rem;
-            border-radius: 12px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07), 0 1px 3px rgba(0, 0, 0, 0.06);
-            border: 1px solid rgba(226, 232, 240, 0.3);
-        }
-        
-        /* Make main background adaptive */
-        .stApp {
-            background: var(--background-color, #0E1117);
-        }
-        
-        /* Ensure text is readable on dark background */
-        .main h1, .main h2, .main h3 {
-            color: #E2E8F0;
-        }
-        
-        p, label, .stMarkdown {
-            color: #CBD5E0;
-        }
-        </style>
-        """).lstrip()
-        st.markdown(custom_css, unsafe_allow_html=True)
+        st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
     @staticmethod
     def render_header():
@@ -163,69 +370,7 @@ class BeautifulUI:
         secondary = EnhancedAppConfig.COLORS["secondary"]
         text_light = EnhancedAppConfig.COLORS["text_light"]
 
-        html = dedent(f"""
-        <div style="
-            max-width: 1200px;
-            margin: 0 auto 2rem auto;
-            padding: 3.5rem 4rem 3rem 4rem;
-            background: linear-gradient(135deg, rgba(15, 23, 42, 0.8) 0%, rgba(30, 41, 59, 0.6) 100%);
-            border-radius: 24px;
-            box-shadow: 0 12px 40px rgba(0, 0, 0, 0.15), 0 4px 12px rgba(0, 0, 0, 0.1), inset 0 1px 0 rgba(255, 255, 255, 0.05);
-            border: 1px solid rgba(226, 232, 240, 0.15);
-            backdrop-filter: blur(20px);
-            position: relative;
-            overflow: visible;
-        ">
-            <!-- Subtle background pattern -->
-            <div style="
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                bottom: 0;
-                background: radial-gradient(circle at 20% 50%, rgba(44, 82, 130, 0.1) 0%, transparent 50%),
-                            radial-gradient(circle at 80% 80%, rgba(30, 58, 95, 0.1) 0%, transparent 50%);
-                pointer-events: none;
-            "></div>
-            
-            <!-- Content wrapper -->
-            <div style="position: relative; z-index: 1;">
-                <!-- Top accent line -->
-                <div style="
-                    width: 100px;
-                    height: 5px;
-                    background: linear-gradient(90deg, {primary} 0%, {secondary} 100%);
-                    border-radius: 3px;
-                    margin: 0 auto 2.5rem auto;
-                    box-shadow: 0 2px 8px rgba(44, 82, 130, 0.4);
-                "></div>
-                
-                <!-- Header Section -->
-                <div style="text-align: center; padding-bottom: 0.5rem;">
-                    <h1 style="
-                        background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
-                        -webkit-background-clip: text;
-                        -webkit-text-fill-color: transparent;
-                        background-clip: text;
-                        font-size: 3.8rem;
-                        margin: 0 0 1rem 0;
-                        font-weight: 800;
-                        line-height: 1.1;
-                        letter-spacing: -0.06em;
-                    ">{EnhancedAppConfig.APP_TITLE}</h1>
-
-                    <p style="
-                        color: {text_light};
-                        font-size: 1.3rem;
-                        margin: 0;
-                        font-weight: 400;
-                        letter-spacing: 0.03em;
-                        opacity: 0.85;
-                    ">AI-Powered News Verification Platform</p>
-                </div>
-            </div>
-        </div>
-        """).lstrip()
+        html = _build_header_html(primary, secondary, text_light, EnhancedAppConfig.APP_TITLE)
 
         components.html(html, height=280, scrolling=False)
 
@@ -248,43 +393,13 @@ class BeautifulUI:
     @staticmethod
     def valid_url(url: str) -> bool:
         """Check if a URL is valid."""
-        return bool(re.match(r'^https?://', url))
+        return _URL_RE.match(url) is not None
 
     @staticmethod
-    @st.cache_data(show_spinner=False)
     def extract_text_from_url(url: str, max_chars=2000) -> str:
-        """Extract text from URL; use newspaper3k if available, otherwise BeautifulSoup fallback."""
-        try:
-            from newspaper import Article
-            a = Article(url)
-            a.download()
-            a.parse()
-            text = a.text or ""
-            if text:
-                return text.strip()[:max_chars]
-        except Exception:
-            pass
-
-        try:
-            headers = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64)'}
-            resp = safe_requests_get(url, headers=headers, timeout=8)
-            if not resp:
-                return ""
-            content_type = resp.headers.get('Content-Type', '')
-            if 'text/html' not in content_type:
-                return ""
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            for script in soup(["script", "style", "noscript"]):
-                script.decompose()
-            paragraphs = soup.find_all('p')
-            extracted = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-            if not extracted:
-                meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
-                if meta and meta.get('content'):
-                    extracted = meta.get('content').strip()
-            return extracted[:max_chars].strip()
-        except Exception:
-            return ""
+        """Extract text from URL (cached in memory by URL digest and on disk across workers)."""
+        url_key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return _cached_article_text(url_key, url, max_chars)
 
     @staticmethod
     def render_verification_form():
@@ -296,35 +411,13 @@ class BeautifulUI:
         secondary = EnhancedAppConfig.COLORS["secondary"]
         
         # Form content wrapper - aligned with header container
-        form_wrapper = dedent(f"""
-        <div style="
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 4rem;
-        ">
-        """).lstrip()
-        st.markdown(form_wrapper, unsafe_allow_html=True)
+        st.markdown(_FORM_WRAPPER_HTML, unsafe_allow_html=True)
         
         # Form content - now aligned with header
         # Select Input Method section with elegant styling
-        input_method_header = dedent(f"""
-            <div style="
-                display: flex;
-                align-items: center;
-                margin-bottom: 1rem;
-                margin-top: 0.5rem;
-            ">
-                <div style="
-                    width: 5px;
-                    height: 28px;
-                    background: linear-gradient(180deg, {primary} 0%, {secondary} 100%);
-                    border-radius: 3px;
-                    margin-right: 1rem;
-                    box-shadow: 0 2px 6px rgba(44, 82, 130, 0.3);
-                "></div>
-                <strong style="color: #E2E8F0; font-size: 1.2rem; font-weight: 600;">Select Input Method</strong>
-            </div>
-            """).lstrip()
+        input_method_header = _build_input_section_header(
+            primary, secondary, "Select Input Method", margin_bottom="1rem", margin_top="0.5rem"
+        )
         st.markdown(input_method_header, unsafe_allow_html=True)
         input_method = st.radio(
             "",
@@ -337,24 +430,7 @@ class BeautifulUI:
         
         if input_method == "Text":
             key = f"news_input_{st.session_state.clear_counter}"
-            news_claim_header = dedent(f"""
-            <div style="
-                display: flex;
-                align-items: center;
-                margin-bottom: 0.8rem;
-                margin-top: 1rem;
-            ">
-                <div style="
-                    width: 5px;
-                    height: 28px;
-                    background: linear-gradient(180deg, {primary} 0%, {secondary} 100%);
-                    border-radius: 3px;
-                    margin-right: 1rem;
-                    box-shadow: 0 2px 6px rgba(44, 82, 130, 0.3);
-                "></div>
-                <strong style="color: #E2E8F0; font-size: 1.2rem; font-weight: 600;">Enter News Claim</strong>
-            </div>
-            """).lstrip()
+            news_claim_header = _build_input_section_header(primary, secondary, "Enter News Claim")
             st.markdown(news_claim_header, unsafe_allow_html=True)
             news_text = st.text_area(
                 "",
@@ -365,24 +441,7 @@ class BeautifulUI:
             )
         else:
             url_key = f"url_input_{st.session_state.clear_counter}"
-            url_header = dedent(f"""
-            <div style="
-                display: flex;
-                align-items: center;
-                margin-bottom: 0.8rem;
-                margin-top: 1rem;
-            ">
-                <div style="
-                    width: 5px;
-                    height: 28px;
-                    background: linear-gradient(180deg, {primary} 0%, {secondary} 100%);
-                    border-radius: 3px;
-                    margin-right: 1rem;
-                    box-shadow: 0 2px 6px rgba(44, 82, 130, 0.3);
-                "></div>
-                <strong style="color: #E2E8F0; font-size: 1.2rem; font-weight: 600;">Enter Article URL</strong>
-            </div>
-            """).lstrip()
+            url_header = _build_input_section_header(primary, secondary, "Enter Article URL")
             st.markdown(url_header, unsafe_allow_html=True)
             url = st.text_input(
                 "",
@@ -424,7 +483,7 @@ class BeautifulUI:
             st.write("")  # Right spacer
             if clear_clicked:
                 st.session_state.clear_counter += 1
-                for k in ["last_query"]:
+                for k in ["last_query", "last_result"]:
                     if k in st.session_state:
                         del st.session_state[k]
                 st.rerun()
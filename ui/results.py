@@ -1,15 +1,366 @@
 """Results display components."""
 
+import hashlib
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from textwrap import dedent
+from functools import lru_cache
+from html import escape
+from io import BytesIO
+from string import Template
+from typing import Any, Dict, NamedTuple
 
 import streamlit as st
-import streamlit.components.v1 as components
 
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:
+    add_script_run_ctx = get_script_run_ctx = None
+
+from utils.caching import claim_hash
 from utils.config import EnhancedAppConfig
 from utils.helpers import safe_filename
 
 
+EVIDENCE_PAGE_SIZE = 10  # Evidence cards shown per "Load more" step
+ANALYSIS_PREVIEW_CHARS = 4000  # Analysis shown in the text area before truncating
+
+# Builds PDF reports off the script thread
+_PDF_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-report")
+
+# Accent bar + h3 heading used by every results section; $extra is optional trailing markup
+_SECTION_HEADER_TMPL = Template("""
+<div style="
+    display: flex;
+    align-items: center;
+    justify-content: flex-start;
+    margin: 2rem 0 1.5rem 0;
+    padding-bottom: 1rem;
+    border-bottom: 1px solid rgba(226, 232, 240, 0.12);
+">
+    <div style="
+        width: 6px;
+        height: 36px;
+        background: linear-gradient(180deg, $primary 0%, $secondary 100%);
+        border-radius: 4px;
+        margin-right: 1.5rem;
+        box-shadow: 0 4px 8px rgba(44, 82, 130, 0.3);
+    "></div>
+    <h3 style="
+        color: #E2E8F0;
+        font-size: 1.8rem;
+        font-weight: 600;
+        margin: 0;
+        letter-spacing: -0.02em;
+    ">$title</h3>$extra
+</div>
+""".lstrip())
+
+# Right-aligned "Analyzed at" note in the Analysis header
+_TIMESTAMP_SPAN_TMPL = Template("""
+    <span style="
+        color: $text_light;
+        font-size: 0.9rem;
+        margin-left: auto;
+        opacity: 0.7;
+    ">Analyzed at $timestamp</span>""")
+
+# No blank lines: st.markdown would end the HTML block there
+_RESULTS_HEADER_TMPL = Template("""
+<div style="
+    max-width: 1200px;
+    margin: 2.5rem auto 0 auto;
+    padding: 3.5rem 4rem;
+    background: linear-gradient(135deg, rgba(15, 23, 42, 0.8) 0%, rgba(30, 41, 59, 0.6) 100%);
+    border-radius: 24px;
+    box-shadow: 0 12px 40px rgba(0, 0, 0, 0.15), 0 4px 12px rgba(0, 0, 0, 0.1), inset 0 1px 0 rgba(255, 255, 255, 0.05);
+    border: 1px solid rgba(226, 232, 240, 0.15);
+    backdrop-filter: blur(20px);
+    position: relative;
+    overflow: hidden;
+">
+    <!-- Subtle background pattern -->
+    <div style="
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: radial-gradient(circle at 20% 50%, rgba(44, 82, 130, 0.1) 0%, transparent 50%),
+                    radial-gradient(circle at 80% 80%, rgba(30, 58, 95, 0.1) 0%, transparent 50%);
+        pointer-events: none;
+    "></div>
+    <!-- Content wrapper -->
+    <div style="position: relative; z-index: 1;">
+        <!-- Top accent line -->
+        <div style="
+            width: 100px;
+            height: 5px;
+            background: linear-gradient(90deg, $primary 0%, $secondary 100%);
+            border-radius: 3px;
+            margin: 0 auto 2rem auto;
+            box-shadow: 0 2px 8px rgba(44, 82, 130, 0.4);
+        "></div>
+        <!-- Results Title Section -->
+        <div style="text-align: center; margin-bottom: 2.5rem; padding-bottom: 2rem; border-bottom: 1px solid rgba(226, 232, 240, 0.12);">
+            <h2 style="
+                background: linear-gradient(135deg, $primary 0%, $secondary 100%);
+                -webkit-background-clip: text;
+                -webkit-text-fill-color: transparent;
+                background-clip: text;
+                font-size: 3rem;
+                margin: 0;
+                font-weight: 700;
+                line-height: 1.1;
+                letter-spacing: -0.04em;
+            ">Verification Results</h2>
+        </div>
+    </div>
+</div>
+""".lstrip())
+
+# One evidence card; all fields are HTML-escaped by the caller
+_EVIDENCE_CARD_TMPL = Template(
+    '<div style="border-left: 3px solid $color; padding: 12px 16px; margin: 12px 0; background: #F7FAFC; border-radius: 4px;">'
+    '<div style="margin-bottom: 8px;"><span style="color: $color; font-weight: 600; font-size: 13px;">$label</span></div>'
+    '<div style="margin-bottom: 6px;"><a href="$link" target="_blank" style="font-size: 15px; color: #2C5282; text-decoration: none; font-weight: 500;">$title</a></div>'
+    '<div style="font-size: 12px; color: #718096; margin-bottom: 8px;">$source • $published</div>'
+    '<div style="font-size: 13px; color: #4A5568; margin-top: 8px; padding-top: 8px; border-top: 1px solid #E2E8F0;"><strong>Rationale:</strong> $rationale</div>'
+    '</div>'
+)
+
+_WEB_LINK_RE = re.compile(r'https?://', re.IGNORECASE)
+
+# Status badge label and color per verification status
+_STATUS_CONFIG = {
+    'TRUE': ('✓ Verified', EnhancedAppConfig.COLORS['success']),
+    'FALSE': ('✗ False', EnhancedAppConfig.COLORS['danger']),
+    'PARTIALLY_TRUE': ('⚠ Partially True', EnhancedAppConfig.COLORS['warning']),
+    'MISLEADING': ('⚠ Misleading', '#D69E2E'),
+    'UNVERIFIED': ('? Unverified', '#718096'),
+    'ERROR': ('Error', '#4A5568')
+}
+
+# Evidence card label and color per alignment tag, and their display order
+_TAG_CONFIG = {
+    'supportive': {'label': '✓ Supports', 'color': EnhancedAppConfig.COLORS['success']},
+    'contradictory': {'label': '✗ Contradicts', 'color': EnhancedAppConfig.COLORS['danger']},
+    'irrelevant': {'label': '○ Not Related', 'color': '#718096'}
+}
+_TAG_ORDER = {'supportive': 0, 'contradictory': 1, 'irrelevant': 2}
+
+# Recommended sources list, sent as one markdown element
+_TRUSTED_SOURCES_HTML = (
+    '<p style="color: #CBD5E0; margin-bottom: 1rem;">For additional verification, check these trusted sources:</p>'
+    + ''.join(f'<p style="color: #CBD5E0; margin: 0.5rem 0;">• {s}</p>' for s in EnhancedAppConfig.TRUSTED_SOURCES)
+)
+
+# Colored accent under the Status metric
+_STATUS_BAR_HTML = '<div style="height: 4px; width: 48px; background: {color}; border-radius: 2px;"></div>'
+
+
+@lru_cache(maxsize=4)
+def _results_header_html(primary: str, secondary: str) -> str:
+    """Results banner HTML for a color scheme, rendered once per process."""
+    return _RESULTS_HEADER_TMPL.substitute(primary=primary, secondary=secondary)
+
+
+@lru_cache(maxsize=16)
+def _section_header_html(primary: str, secondary: str, title: str) -> str:
+    """Static section header HTML (no trailing markup), rendered once per title."""
+    return _SECTION_HEADER_TMPL.substitute(primary=primary, secondary=secondary, title=title, extra="")
+
+
+_CHART_BARS = (
+    ('Supportive', EnhancedAppConfig.COLORS['success']),
+    ('Contradictory', EnhancedAppConfig.COLORS['danger']),
+    ('Irrelevant', '#718096')
+)
+
+
+@lru_cache(maxsize=64)
+def _three_bar_svg(supportive: int, contradictory: int, irrelevant: int) -> str:
+    """Evidence alignment distribution as a static inline SVG bar chart."""
+    width, height, top, bottom = 400, 250, 40, 30
+    plot_height = height - top - bottom
+    peak = max(supportive, contradictory, irrelevant, 1)
+    parts = [
+        f'<svg viewBox="0 0 {width} {height}" width="100%" style="max-width: 600px;" role="img" '
+        'aria-label="Evidence Alignment Distribution" font-family="sans-serif">',
+        '<text x="200" y="20" text-anchor="middle" fill="#E2E8F0" font-size="14" font-weight="600">'
+        'Evidence Alignment Distribution</text>'
+    ]
+    for i, ((label, color), count) in enumerate(zip(_CHART_BARS, (supportive, contradictory, irrelevant))):
+        x = 40 + i * 120
+        bar_height = round(plot_height * count / peak)
+        y = top + plot_height - bar_height
+        parts.append(
+            f'<rect x="{x}" y="{y}" width="80" height="{bar_height}" rx="3" fill="{color}">'
+            f'<title>{label}: {count}</title></rect>'
+            f'<text x="{x + 40}" y="{y - 6}" text-anchor="middle" fill="#CBD5E0" font-size="12">{count}</text>'
+            f'<text x="{x + 40}" y="{height - 10}" text-anchor="middle" fill="#CBD5E0" font-size="12">{label}</text>'
+        )
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+class _ReportLab(NamedTuple):
+    """ReportLab symbols used by the PDF report."""
+    A4: Any
+    SimpleDocTemplate: Any
+    Paragraph: Any
+    Spacer: Any
+    Table: Any
+    TableStyle: Any
+    getSampleStyleSheet: Any
+    ParagraphStyle: Any
+    inch: float
+    colors: Any
+    TA_CENTER: int
+    TA_JUSTIFY: int
+
+
+@lru_cache(maxsize=1)
+def _reportlab_libs() -> _ReportLab:
+    """ReportLab symbols, imported on first PDF build (raises ImportError if missing)."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    return _ReportLab(A4, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+                      getSampleStyleSheet, ParagraphStyle, inch, colors, TA_CENTER, TA_JUSTIFY)
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _build_pdf(result_hash: str, _result_data: Dict[str, Any], news_claim: str) -> bytes:
+    """
+    PDF report bytes for a verification result.
+    Keyed on result_hash so Streamlit does not hash the whole result dict.
+    """
+    (A4, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+     getSampleStyleSheet, ParagraphStyle, inch, colors, TA_CENTER, TA_JUSTIFY) = _reportlab_libs()
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    story = []
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=20, textColor=colors.HexColor(EnhancedAppConfig.COLORS['primary']), alignment=TA_CENTER)
+    subtitle_style = ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=12, textColor=colors.HexColor(EnhancedAppConfig.COLORS['secondary']), alignment=TA_CENTER)
+    body_style = ParagraphStyle('Body', parent=styles['Normal'], fontSize=11, alignment=TA_JUSTIFY, leading=14)
+
+    story.append(Paragraph("Bharat Fact", title_style))
+    story.append(Paragraph("AI-Powered Fact Checking Report", subtitle_style))
+    story.append(Spacer(1, 0.2*inch))
+
+    story.append(Paragraph("<b>News Claim Verified:</b>", styles['Heading3']))
+    story.append(Paragraph(f'"{news_claim}"', body_style))
+    story.append(Spacer(1, 0.1*inch))
+
+    verification_data = [
+        ['Verification Status', _result_data['status']],
+        ['Confidence Level', f"{_result_data['confidence']}%"],
+        ['Evidence Analyzed', f"{_result_data['evidence_count']} articles"],
+        ['Analysis Date', _result_data['timestamp']]
+    ]
+    table = Table(verification_data, colWidths=[2.5*inch, 3.5*inch])
+    table.setStyle(TableStyle([
+        ('GRID', (0,0), (-1,-1), 0.5, colors.HexColor('#BDC3C7')),
+        ('BACKGROUND', (0,0), (0,-1), colors.HexColor('#ECF0F1')),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ]))
+    story.append(table)
+    story.append(Spacer(1, 0.2*inch))
+
+    analysis_text = _result_data.get('analysis', '')
+    analysis_chunks = [c.strip() for c in analysis_text.split('\n') if c.strip()]
+    for para in analysis_chunks[:40]:
+        story.append(Paragraph(para, body_style))
+        story.append(Spacer(1, 0.05*inch))
+
+    if _result_data.get('live_evidence'):
+        story.append(Spacer(1, 0.1*inch))
+        story.append(Paragraph("<b>Live Evidence Sources Analyzed:</b>", styles['Heading3']))
+        for evidence in _result_data['live_evidence'][:5]:
+            story.append(Paragraph(f"• {evidence.get('title','')[:120]}...", body_style))
+            story.append(Spacer(1, 0.02*inch))
+
+    story.append(Spacer(1, 0.2*inch))
+    story.append(Paragraph("<b>Recommended Sources</b>", styles['Heading3']))
+    story.append(Paragraph("<br/>".join(f"• {s}" for s in EnhancedAppConfig.TRUSTED_SOURCES), body_style))
+
+    disclaimer = Paragraph("<i>This is an AI-assisted analysis with live evidence. Always verify important news with multiple reliable sources.</i>", ParagraphStyle('disclaimer', parent=styles['Normal'], fontSize=9, alignment=TA_CENTER))
+    story.append(Spacer(1, 0.2*inch))
+    story.append(disclaimer)
+    story.append(Spacer(1, 0.1*inch))
+    story.append(
+        Paragraph(
+            f"<i>Report generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</i>",
+            ParagraphStyle(
+                'meta',
+                parent=styles['Normal'],
+                fontSize=9,
+                alignment=TA_CENTER
+            )
+        )
+    )
+
+    doc.build(story)
+    buffer.seek(0)
+    return buffer.getvalue()
+
+
+def _result_fingerprint(result_data: Dict[str, Any], query_text: str) -> int:
+    """Cheap identity for a rendered result; changes whenever a new verification is shown."""
+    return hash((
+        claim_hash(query_text or ''),
+        result_data.get('status'),
+        result_data.get('confidence'),
+        result_data.get('evidence_count'),
+        result_data.get('timestamp')
+    ))
+
+
+def _result_fragments(fp: int) -> Dict[str, Any]:
+    """
+    Per-session store of HTML fragments and view state for the current result.
+    Reruns for the same result reuse them; a new fingerprint starts a fresh store.
+    """
+    cached = st.session_state.get('_result_fragments')
+    if cached is None or cached[0] != fp:
+        cached = (fp, {})
+        st.session_state['_result_fragments'] = cached
+    return cached[1]
+
+
+def _run_with_script_ctx(ctx, fn, *args):
+    """
+    Pool task wrapper: attach the submitting session's script context first.
+    The PDF pool is shared across sessions, so this is done per task rather than in an initializer.
+    """
+    if ctx is not None and add_script_run_ctx is not None:
+        add_script_run_ctx(threading.current_thread(), ctx)
+    return fn(*args)
+
+
+def _pdf_future(result_data: Dict[str, Any], fragments: Dict[str, Any]) -> Future:
+    """Future for the current result's PDF bytes, submitted to the background pool once."""
+    future = fragments.get('pdf_future')
+    if future is None:
+        news_claim = st.session_state.get('last_query', '') or 'Not available'
+        # Not a claim: hash directly so the memoized claim_hash doesn't hold analysis text
+        result_hash = hashlib.blake2b(
+            f"{result_data['status']}|{result_data.get('timestamp', '')}|{result_data.get('analysis', '')}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        ctx = get_script_run_ctx() if get_script_run_ctx is not None else None
+        future = _PDF_POOL.submit(_run_with_script_ctx, ctx, _build_pdf, result_hash, result_data, news_claim)
+        fragments['pdf_future'] = future
+    return future
+
+
 class EnhancedUI:
     """UI components for displaying verification results."""
     
@@ -23,135 +374,32 @@ class EnhancedUI:
         primary = EnhancedAppConfig.COLORS["primary"]
         secondary = EnhancedAppConfig.COLORS["secondary"]
         text_light = EnhancedAppConfig.COLORS["text_light"]
+        fragments = _result_fragments(_result_fingerprint(result_data, query_text))
+        # Start the PDF now so it is usually ready by the time the Download section renders
+        _pdf_future(result_data, fragments)
         
         # Elegant results container - matching header style
-        results_header_html = dedent(f"""
-        <div style="
-            max-width: 1200px;
-            margin: 2.5rem auto 0 auto;
-            padding: 3.5rem 4rem;
-            background: linear-gradient(135deg, rgba(15, 23, 42, 0.8) 0%, rgba(30, 41, 59, 0.6) 100%);
-            border-radius: 24px;
-            box-shadow: 0 12px 40px rgba(0, 0, 0, 0.15), 0 4px 12px rgba(0, 0, 0, 0.1), inset 0 1px 0 rgba(255, 255, 255, 0.05);
-            border: 1px solid rgba(226, 232, 240, 0.15);
-            backdrop-filter: blur(20px);
-            position: relative;
-            overflow: hidden;
-        ">
-            <!-- Subtle background pattern -->
-            <div style="
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                bottom: 0;
-                background: radial-gradient(circle at 20% 50%, rgba(44, 82, 130, 0.1) 0%, transparent 50%),
-                            radial-gradient(circle at 80% 80%, rgba(30, 58, 95, 0.1) 0%, transparent 50%);
-                pointer-events: none;
-            "></div>
-            
-            <!-- Content wrapper -->
-            <div style="position: relative; z-index: 1;">
-                <!-- Top accent line -->
-                <div style="
-                    width: 100px;
-                    height: 5px;
-                    background: linear-gradient(90deg, {primary} 0%, {secondary} 100%);
-                    border-radius: 3px;
-                    margin: 0 auto 2rem auto;
-                    box-shadow: 0 2px 8px rgba(44, 82, 130, 0.4);
-                "></div>
-                
-                <!-- Results Title Section -->
-                <div style="text-align: center; margin-bottom: 2.5rem; padding-bottom: 2rem; border-bottom: 1px solid rgba(226, 232, 240, 0.12);">
-                    <h2 style="
-                        background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
-                        -webkit-background-clip: text;
-                        -webkit-text-fill-color: transparent;
-                        background-clip: text;
-                        font-size: 3rem;
-                        margin: 0;
-                        font-weight: 700;
-                        line-height: 1.1;
-                        letter-spacing: -0.04em;
-                    ">Verification Results</h2>
-                </div>
-            </div>
-        </div>
-        """).lstrip()
+        results_header_html = _results_header_html(primary, secondary)
         
-        components.html(results_header_html, height=200, scrolling=False)
+        st.markdown(results_header_html, unsafe_allow_html=True)
         
         # Content wrapper with same max-width - using container
         with st.container():
             st.markdown('<div style="max-width: 1200px; margin: 0 auto; padding: 0 4rem 2rem 4rem;">', unsafe_allow_html=True)
         
-        # Status badge with color
-        status_config = {
-            'TRUE': ('✓ Verified', EnhancedAppConfig.COLORS['success']),
-            'FALSE': ('✗ False', EnhancedAppConfig.COLORS['danger']),
-            'PARTIALLY_TRUE': ('⚠ Partially True', EnhancedAppConfig.COLORS['warning']),
-            'MISLEADING': ('⚠ Misleading', '#D69E2E'),
-            'UNVERIFIED': ('? Unverified', '#718096'),
-            'ERROR': ('Error', '#4A5568')
-        }
-        
-        status_label, status_color = status_config.get(
+        status_label, status_color = _STATUS_CONFIG.get(
             result_data['status'], 
             ('Unverified', '#718096')
         )
-        
-        # Key metrics in elegant cards
-        metrics_html = dedent(f"""
-        <div style="
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 1.5rem;
-            margin: 2rem 0;
-        ">
-            <div style="
-                background: linear-gradient(135deg, rgba(15, 23, 42, 0.6) 0%, rgba(30, 41, 59, 0.4) 100%);
-                padding: 1.5rem;
-                border-radius: 12px;
-                border: 1px solid rgba(226, 232, 240, 0.1);
-                text-align: center;
-            ">
-                <div style="color: #CBD5E0; font-size: 0.9rem; font-weight: 600; margin-bottom: 0.5rem;">Status</div>
-                <div style="color: {status_color}; font-size: 1.8rem; font-weight: 700;">{status_label}</div>
-            </div>
-            <div style="
-                background: linear-gradient(135deg, rgba(15, 23, 42, 0.6) 0%, rgba(30, 41, 59, 0.4) 100%);
-                padding: 1.5rem;
-                border-radius: 12px;
-                border: 1px solid rgba(226, 232, 240, 0.1);
-                text-align: center;
-            ">
-                <div style="color: #CBD5E0; font-size: 0.9rem; font-weight: 600; margin-bottom: 0.5rem;">Confidence</div>
-                <div style="color: {primary}; font-size: 1.8rem; font-weight: 700;">{result_data['confidence']}%</div>
-            </div>
-            <div style="
-                background: linear-gradient(135deg, rgba(15, 23, 42, 0.6) 0%, rgba(30, 41, 59, 0.4) 100%);
-                padding: 1.5rem;
-                border-radius: 12px;
-                border: 1px solid rgba(226, 232, 240, 0.1);
-                text-align: center;
-            ">
-                <div style="color: #CBD5E0; font-size: 0.9rem; font-weight: 600; margin-bottom: 0.5rem;">Evidence</div>
-                <div style="color: {primary}; font-size: 1.8rem; font-weight: 700;">{result_data['evidence_count']} articles</div>
-            </div>
-            <div style="
-                background: linear-gradient(135deg, rgba(15, 23, 42, 0.6) 0%, rgba(30, 41, 59, 0.4) 100%);
-                padding: 1.5rem;
-                border-radius: 12px;
-                border: 1px solid rgba(226, 232, 240, 0.1);
-                text-align: center;
-            ">
-                <div style="color: #CBD5E0; font-size: 0.9rem; font-weight: 600; margin-bottom: 0.5rem;">Time</div>
-                <div style="color: {primary}; font-size: 1.4rem; font-weight: 700;">{result_data['timestamp'].split(' ')[1] if 'timestamp' in result_data else 'N/A'}</div>
-            </div>
-        </div>
-        """).lstrip()
-        st.markdown(metrics_html, unsafe_allow_html=True)
+        time_str = result_data['timestamp'].split(' ')[1] if 'timestamp' in result_data else 'N/A'
+
+        # Key metrics as native widgets; a thin bar under Status carries its color
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Status", status_label)
+        col1.markdown(_STATUS_BAR_HTML.format(color=status_color), unsafe_allow_html=True)
+        col2.metric("Confidence", f"{result_data['confidence']}%")
+        col3.metric("Evidence", f"{result_data['evidence_count']} articles")
+        col4.metric("Time", time_str)
         
         st.markdown("")
         
@@ -166,94 +414,71 @@ class EnhancedUI:
         st.markdown("")
         
         # Analysis section with elegant styling
-        analysis_header_html = dedent(f"""
-        <div style="
-            display: flex;
-            align-items: center;
-            justify-content: flex-start;
-            margin: 2rem 0 1.5rem 0;
-            padding-bottom: 1rem;
-            border-bottom: 1px solid rgba(226, 232, 240, 0.12);
-        ">
-            <div style="
-                width: 6px;
-                height: 36px;
-                background: linear-gradient(180deg, {primary} 0%, {secondary} 100%);
-                border-radius: 4px;
-                margin-right: 1.5rem;
-                box-shadow: 0 4px 8px rgba(44, 82, 130, 0.3);
-            "></div>
-            <h3 style="
-                color: #E2E8F0;
-                font-size: 1.8rem;
-                font-weight: 600;
-                margin: 0;
-                letter-spacing: -0.02em;
-            ">Analysis</h3>
-            <span style="
-                color: {text_light};
-                font-size: 0.9rem;
-                margin-left: auto;
-                opacity: 0.7;
-            ">Analyzed at {result_data.get('timestamp', 'N/A')}</span>
-        </div>
-        """).lstrip()
+        analysis_header_html = fragments.get('analysis_header')
+        if analysis_header_html is None:
+            analysis_header_html = _SECTION_HEADER_TMPL.substitute(
+                primary=primary,
+                secondary=secondary,
+                title="Analysis",
+                extra=_TIMESTAMP_SPAN_TMPL.substitute(
+                    text_light=text_light,
+                    timestamp=result_data.get('timestamp', 'N/A')
+                )
+            )
+            fragments['analysis_header'] = analysis_header_html
         st.markdown(analysis_header_html, unsafe_allow_html=True)
         
+        analysis = result_data['analysis']
+        # The full text is only sent once asked for; collapsed elements are still sent every run
+        truncated = len(analysis) > ANALYSIS_PREVIEW_CHARS and not fragments.get('full_analysis')
         with st.expander("View detailed analysis", expanded=True):
             st.text_area(
                 "AI Analysis:",
-                value=result_data['analysis'],
+                value=analysis[:ANALYSIS_PREVIEW_CHARS] + "\n...[truncated]" if truncated else analysis,
                 height=300,
                 disabled=True,
                 label_visibility="collapsed"
             )
+            if truncated:
+                st.button(
+                    "Show full analysis",
+                    key="analysis_show_full",
+                    on_click=fragments.__setitem__,
+                    args=('full_analysis', True)
+                )
         
         st.markdown("")
         
         # Evidence section with elegant styling
-        evidence_header_html = dedent(f"""
-        <div style="
-            display: flex;
-            align-items: center;
-            justify-content: flex-start;
-            margin: 2rem 0 1.5rem 0;
-            padding-bottom: 1rem;
-            border-bottom: 1px solid rgba(226, 232, 240, 0.12);
-        ">
-            <div style="
-                width: 6px;
-                height: 36px;
-                background: linear-gradient(180deg, {primary} 0%, {secondary} 100%);
-                border-radius: 4px;
-                margin-right: 1.5rem;
-                box-shadow: 0 4px 8px rgba(44, 82, 130, 0.3);
-            "></div>
-            <h3 style="
-                color: #E2E8F0;
-                font-size: 1.8rem;
-                font-weight: 600;
-                margin: 0;
-                letter-spacing: -0.02em;
-            ">Evidence</h3>
-        </div>
-        """).lstrip()
+        evidence_header_html = _section_header_html(primary, secondary, "Evidence")
         st.markdown(evidence_header_html, unsafe_allow_html=True)
         
         live_evidence = result_data.get('live_evidence', [])
+        # (title, link, source, published date) per article, normalized once for both views
+        rows = [
+            (e['title'], e['link'], e.get('source') or '', (e.get('published') or '')[:10])
+            for e in live_evidence
+        ]
         
         if not live_evidence:
             st.info("No direct online evidence found from trusted sources.")
         else:
-            with st.spinner("Analyzing evidence alignment..."):
-                verifier = st.session_state.get('hybrid_verifier')
-                if verifier:
-                    try:
-                        tags_result = verifier.tag_evidence_support(query_text, live_evidence)
-                    except Exception:
+            evidence_key = tuple(link for _, link, _, _ in rows)
+            tags_key = f"tags::{claim_hash(query_text)}::{hash(evidence_key)}"
+            tags_result = st.session_state.get(tags_key)
+            if tags_result is None:
+                with st.spinner("Analyzing evidence alignment..."):
+                    verifier = st.session_state.get('hybrid_verifier')
+                    if verifier:
+                        try:
+                            tags_result = verifier.tag_evidence_support(query_text, live_evidence)
+                            # Only a successful tagging is kept; an empty one is retried next run
+                            if tags_result.get('items'):
+                                st.session_state[tags_key] = tags_result
+                        except Exception:
+                            tags_result = {"items": [], "counts": {}}
+                    else:
                         tags_result = {"items": [], "counts": {}}
-                else:
-                    tags_result = {"items": [], "counts": {}}
             
             if tags_result and tags_result.get('items'):
                 counts = tags_result.get('counts', {})
@@ -275,133 +500,66 @@ class EnhancedUI:
                     consensus = "High" if supportive > contradictory * 2 else "Medium" if supportive > contradictory else "Low" if contradictory > supportive else "Mixed"
                     st.metric("Consensus", consensus)
                 
-                try:
-                    import pandas as pd
-                    import altair as alt
-                    
-                    chart_data = pd.DataFrame({
-                        'Type': ['Supportive', 'Contradictory', 'Irrelevant'],
-                        'Count': [supportive, contradictory, irrelevant]
-                    })
-                    
-                    bar_chart = alt.Chart(chart_data).mark_bar().encode(
-                        x=alt.X('Type:N', sort=None, title='Evidence Type', axis=alt.Axis(labelAngle=0)),
-                        y=alt.Y('Count:Q', title='Number of Articles'),
-                        color=alt.Color('Type:N', scale=alt.Scale(
-                            domain=['Supportive', 'Contradictory', 'Irrelevant'],
-                            range=[EnhancedAppConfig.COLORS['success'], EnhancedAppConfig.COLORS['danger'], '#718096']
-                        ), legend=None),
-                        tooltip=[alt.Tooltip('Type:N', title='Type'), alt.Tooltip('Count:Q', title='Count')]
-                    ).properties(
-                        height=250,
-                        title="Evidence Alignment Distribution"
-                    )
-                    
-                    st.altair_chart(bar_chart, use_container_width=True)
-                    
-                except Exception:
-                    st.markdown("**Evidence Distribution:**")
-                    if supportive > 0:
-                        st.markdown(f"Supportive: {'█' * supportive} ({supportive})")
-                    if contradictory > 0:
-                        st.markdown(f"Contradictory: {'█' * contradictory} ({contradictory})")
-                    if irrelevant > 0:
-                        st.markdown(f"Irrelevant: {'█' * irrelevant} ({irrelevant})")
+                st.markdown(_three_bar_svg(supportive, contradictory, irrelevant), unsafe_allow_html=True)
                 
                 with st.expander("View detailed evidence", expanded=False):
-                    sorted_items = sorted(tags_result['items'], 
-                                        key=lambda x: ['supportive', 'contradictory', 'irrelevant'].index(x['tag']))
+                    cards = fragments.get('evidence_cards')
+                    if cards is None:
+                        sorted_items = sorted(tags_result['items'], key=lambda x: _TAG_ORDER.get(x['tag'], 3))
                     
-                    for item in sorted_items:
-                        idx = item['index']
-                        if 0 <= idx-1 < len(live_evidence):
-                            article = live_evidence[idx-1]
-                            
-                            tag_config = {
-                                'supportive': {'label': '✓ Supports', 'color': EnhancedAppConfig.COLORS['success']},
-                                'contradictory': {'label': '✗ Contradicts', 'color': EnhancedAppConfig.COLORS['danger']},
-                                'irrelevant': {'label': '○ Not Related', 'color': '#718096'}
-                            }
-                            
-                            config = tag_config.get(item['tag'], tag_config['irrelevant'])
+                        cards = []
+                        for item in sorted_items:
+                            idx = item['index']
+                            if 0 <= idx-1 < len(rows):
+                                title, link, source, published = rows[idx-1]
+                                config = _TAG_CONFIG.get(item['tag'], _TAG_CONFIG['irrelevant'])
                             
-                            card_html = dedent(f"""
-                            <div style="
-                                border-left: 3px solid {config['color']}; 
-                                padding: 12px 16px; 
-                                margin: 12px 0; 
-                                background: #F7FAFC;
-                                border-radius: 4px;
-                            ">
-                                <div style="margin-bottom: 8px;">
-                                    <span style="
-                                        color: {config['color']}; 
-                                        font-weight: 600; 
-                                        font-size: 13px;
-                                    ">{config['label']}</span>
-                                </div>
-                                <div style="margin-bottom: 6px;">
-                                    <a href="{article['link']}" target="_blank" style="
-                                        font-size: 15px; 
-                                        color: #2C5282; 
-                                        text-decoration: none;
-                                        font-weight: 500;
-                                    ">{article['title']}</a>
-                                </div>
-                                <div style="font-size: 12px; color: #718096; margin-bottom: 8px;">
-                                    {article.get('source', 'Unknown')} • {article.get('published', 'Unknown date')[:10] if article.get('published') else 'Unknown date'}
-                                </div>
-                                <div style="font-size: 13px; color: #4A5568; margin-top: 8px; padding-top: 8px; border-top: 1px solid #E2E8F0;">
-                                    <strong>Rationale:</strong> {item['rationale']}
-                                </div>
-                            </div>
-                            """).lstrip()
-
-                            components.html(card_html, height=160, scrolling=False)
+                                color, label = config['color'], config['label']
+                                # Cards are inlined into the page DOM, so escape the fetched text
+                                # Only web links become hrefs; javascript: and other schemes get '#'
+                                link = escape(link) if _WEB_LINK_RE.match(link) else '#'
+                                title = escape(title)
+                                source = escape(source or 'Unknown')
+                                published = escape(published or 'Unknown date')
+                                rationale = escape(item['rationale'])
+                                card_html = _EVIDENCE_CARD_TMPL.substitute(
+                                    color=color,
+                                    label=label,
+                                    link=link,
+                                    title=title,
+                                    source=source,
+                                    published=published,
+                                    rationale=rationale
+                                )
+                                cards.append(card_html)
+                        fragments['evidence_cards'] = cards
+
+                    # One DOM insertion per page of cards instead of an iframe per card
+                    page = fragments.get('evidence_page', EVIDENCE_PAGE_SIZE)
+                    st.markdown(''.join(cards[:page]), unsafe_allow_html=True)
+                    if len(cards) > page:
+                        st.button(
+                            "Load more",
+                            key="evidence_load_more",
+                            on_click=fragments.__setitem__,
+                            args=('evidence_page', page + EVIDENCE_PAGE_SIZE)
+                        )
             else:
                 st.markdown(f"**Found {len(live_evidence)} related article(s):**")
-                for e in live_evidence:
-                    pub = e.get('published', '')[:10] if e.get('published') else ''
-                    source_info = f" • {e.get('source', '')}" if e.get('source') else ""
-                    pub_info = f" • {pub}" if pub else ""
-                    st.markdown(f"- [{e['title']}]({e['link']}){source_info}{pub_info}")
+                st.markdown("\n".join(
+                    f"- [{title}]({link})" + (f" • {source}" if source else "") + (f" • {pub}" if pub else "")
+                    for title, link, source, pub in rows
+                ))
 
         st.markdown("")
         
         # Recommended Sources section with elegant styling
-        sources_header_html = dedent(f"""
-        <div style="
-            display: flex;
-            align-items: center;
-            justify-content: flex-start;
-            margin: 2rem 0 1.5rem 0;
-            padding-bottom: 1rem;
-            border-bottom: 1px solid rgba(226, 232, 240, 0.12);
-        ">
-            <div style="
-                width: 6px;
-                height: 36px;
-                background: linear-gradient(180deg, {primary} 0%, {secondary} 100%);
-                border-radius: 4px;
-                margin-right: 1.5rem;
-                box-shadow: 0 4px 8px rgba(44, 82, 130, 0.3);
-            "></div>
-            <h3 style="
-                color: #E2E8F0;
-                font-size: 1.8rem;
-                font-weight: 600;
-                margin: 0;
-                letter-spacing: -0.02em;
-            ">Recommended Sources</h3>
-        </div>
-        """).lstrip()
+        sources_header_html = _section_header_html(primary, secondary, "Recommended Sources")
         st.markdown(sources_header_html, unsafe_allow_html=True)
-        st.markdown('<p style="color: #CBD5E0; margin-bottom: 1rem;">For additional verification, check these trusted sources:</p>', unsafe_allow_html=True)
-        for s in EnhancedAppConfig.TRUSTED_SOURCES:
-            st.markdown(f'<p style="color: #CBD5E0; margin: 0.5rem 0;">• {s}</p>', unsafe_allow_html=True)
+        st.markdown(_TRUSTED_SOURCES_HTML, unsafe_allow_html=True)
 
         st.markdown("")
-        EnhancedUI.render_download_section(result_data)
+        EnhancedUI.render_download_section(result_data, query_text)
 
         if result_data.get("cached"):
             st.info("⚡ Result loaded from cache (no new API calls)")
@@ -411,130 +569,33 @@ class EnhancedUI:
         st.markdown('</div>', unsafe_allow_html=True)
     
     @staticmethod
-    def render_download_section(result_data):
+    def render_download_section(result_data, query_text=None):
         """Render the download section for PDF reports."""
         primary = EnhancedAppConfig.COLORS["primary"]
         secondary = EnhancedAppConfig.COLORS["secondary"]
         
         # Download section with elegant styling
-        download_header_html = dedent(f"""
-        <div style="
-            display: flex;
-            align-items: center;
-            justify-content: flex-start;
-            margin: 2rem 0 1.5rem 0;
-            padding-bottom: 1rem;
-            border-bottom: 1px solid rgba(226, 232, 240, 0.12);
-        ">
-            <div style="
-                width: 6px;
-                height: 36px;
-                background: linear-gradient(180deg, {primary} 0%, {secondary} 100%);
-                border-radius: 4px;
-                margin-right: 1.5rem;
-                box-shadow: 0 4px 8px rgba(44, 82, 130, 0.3);
-            "></div>
-            <h3 style="
-                color: #E2E8F0;
-                font-size: 1.8rem;
-                font-weight: 600;
-                margin: 0;
-                letter-spacing: -0.02em;
-            ">Download Report</h3>
-        </div>
-        """).lstrip()
+        download_header_html = _section_header_html(primary, secondary, "Download Report")
         st.markdown(download_header_html, unsafe_allow_html=True)
         
-        def generate_pdf_report_bytes():
-            from io import BytesIO
-            from reportlab.lib.pagesizes import A4
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            from reportlab.lib import colors
-            from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
-
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch, bottomMargin=0.5*inch)
-            story = []
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=20, textColor=colors.HexColor(EnhancedAppConfig.COLORS['primary']), alignment=TA_CENTER)
-            subtitle_style = ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=12, textColor=colors.HexColor(EnhancedAppConfig.COLORS['secondary']), alignment=TA_CENTER)
-            body_style = ParagraphStyle('Body', parent=styles['Normal'], fontSize=11, alignment=TA_JUSTIFY, leading=14)
-
-            story.append(Paragraph("Bharat Fact", title_style))
-            story.append(Paragraph("AI-Powered Fact Checking Report", subtitle_style))
-            story.append(Spacer(1, 0.2*inch))
-
-            news_claim = st.session_state.get('last_query', 'Not available')
-            story.append(Paragraph("<b>News Claim Verified:</b>", styles['Heading3']))
-            story.append(Paragraph(f'"{news_claim}"', body_style))
-            story.append(Spacer(1, 0.1*inch))
-
-            verification_data = [
-                ['Verification Status', result_data['status']],
-                ['Confidence Level', f"{result_data['confidence']}%"],
-                ['Evidence Analyzed', f"{result_data['evidence_count']} articles"],
-                ['Analysis Date', result_data['timestamp']]
-            ]
-            table = Table(verification_data, colWidths=[2.5*inch, 3.5*inch])
-            table.setStyle(TableStyle([
-                ('GRID', (0,0), (-1,-1), 0.5, colors.HexColor('#BDC3C7')),
-                ('BACKGROUND', (0,0), (0,-1), colors.HexColor('#ECF0F1')),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-            ]))
-            story.append(table)
-            story.append(Spacer(1, 0.2*inch))
-
-            analysis_text = result_data.get('analysis', '')
-            analysis_chunks = [c.strip() for c in analysis_text.split('\n') if c.strip()]
-            for para in analysis_chunks[:40]:
-                story.append(Paragraph(para, body_style))
-                story.append(Spacer(1, 0.05*inch))
-
-            if result_data.get('live_evidence'):
-                story.append(Spacer(1, 0.1*inch))
-                story.append(Paragraph("<b>Live Evidence Sources Analyzed:</b>", styles['Heading3']))
-                for evidence in result_data['live_evidence'][:5]:
-                    story.append(Paragraph(f"• {evidence.get('title','')[:120]}...", body_style))
-                    story.append(Spacer(1, 0.02*inch))
-
-            story.append(Spacer(1, 0.2*inch))
-            story.append(Paragraph("<b>Recommended Sources</b>", styles['Heading3']))
-            for s in EnhancedAppConfig.TRUSTED_SOURCES:
-                story.append(Paragraph(f"• {s}", body_style))
-
-            disclaimer = Paragraph("<i>This is an AI-assisted analysis with live evidence. Always verify important news with multiple reliable sources.</i>", ParagraphStyle('disclaimer', parent=styles['Normal'], fontSize=9, alignment=TA_CENTER))
-            story.append(Spacer(1, 0.2*inch))
-            story.append(disclaimer)
-            story.append(Spacer(1, 0.1*inch))
-            story.append(
-                Paragraph(
-                    f"<i>Report generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</i>",
-                    ParagraphStyle(
-                        'meta',
-                        parent=styles['Normal'],
-                        fontSize=9,
-                        alignment=TA_CENTER
-                    )
-                )
-            )
-
-            doc.build(story)
-            buffer.seek(0)
-            return buffer.getvalue()
-
         try:
-            pdf_bytes = generate_pdf_report_bytes()
-            news_claim = st.session_state.get('last_query', '')
-            if news_claim:
-                clean_name = safe_filename(news_claim)[:50]
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"bharatfact_{clean_name}_{timestamp}.pdf"
-            else:
-                filename = f"bharatfact_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            if query_text is None:
+                query_text = st.session_state.get('last_query', '')
+            fragments = _result_fragments(_result_fingerprint(result_data, query_text))
+            pdf_bytes = _pdf_future(result_data, fragments).result()
+            if pdf_bytes:
+                # Filename is fixed per result, so build it once rather than on every rerun
+                filename = fragments.get('pdf_filename')
+                if filename is None:
+                    news_claim = st.session_state.get('last_query', '')
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    if news_claim:
+                        filename = f"bharatfact_{safe_filename(news_claim)[:50]}_{timestamp}.pdf"
+                    else:
+                        filename = f"bharatfact_{timestamp}.pdf"
+                    fragments['pdf_filename'] = filename
 
-            st.download_button("Download PDF Report", data=pdf_bytes, file_name=filename, mime="application/pdf")
+                st.download_button("Download PDF Report", data=pdf_bytes, file_name=filename, mime="application/pdf")
         except Exception as e:
             st.error(f"Error generating PDF: {e}")
             st.info("Install reportlab: pip install reportlab")
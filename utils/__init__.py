@@ -4,10 +4,15 @@ from .config import EnhancedAppConfig, get_api_key
 from .caching import (
     load_verification_cache,
     save_verification_cache,
+    append_verification_entry,
+    record_verification_hit,
     load_model_cache,
     save_model_cache,
     claim_hash,
-    normalize_claim
+    legacy_claim_hash,
+    normalize_claim,
+    load_url_text,
+    save_url_text
 )
 from .helpers import (
     safe_requests_get,
@@ -20,10 +25,15 @@ __all__ = [
     'get_api_key',
     'load_verification_cache',
     'save_verification_cache',
+    'append_verification_entry',
+    'record_verification_hit',
     'load_model_cache',
     'save_model_cache',
     'claim_hash',
+    'legacy_claim_hash',
     'normalize_claim',
+    'load_url_text',
+    'save_url_text',
     'safe_requests_get',
     'extract_first_json',
     'safe_filename',
@@ -2,47 +2,218 @@
 
 import json
 import hashlib
+import heapq
+import logging
+import mmap
 import re
 import os
 import tempfile
+import threading
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
-import streamlit as st
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+    _HAS_ORJSON = True
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
+    _HAS_ORJSON = False
+
+try:
+    import fcntl
+except ImportError:  # Windows: log compaction is only serialized within this process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
 
 # Cache configuration
 CACHE_DIR = Path(".cache")
 CACHE_DIR.mkdir(exist_ok=True)
 CACHE_FILE = CACHE_DIR / "verification_cache.json"
+CACHE_LOG_FILE = CACHE_DIR / "verification_cache.log"  # Append-only updates since last compaction
 MODEL_CACHE_FILE = CACHE_DIR / "model_cache.json"
 MAX_CACHE_SIZE = 100  # Maximum number of cached verifications
 CACHE_TTL_DAYS = 30  # Cache expires after 30 days
+LOG_COMPACT_LINES = MAX_CACHE_SIZE // 4  # Fold the log into CACHE_FILE past this many entries
+MMAP_MIN_BYTES = 8192  # Cache files larger than this are parsed from an mmap
+WRITE_BUFFER_BYTES = 65536  # Buffer for atomic cache file writes
+URL_TEXT_CACHE_DIR = CACHE_DIR / "url_text"
+URL_TEXT_TTL_HOURS = 24  # Extracted article text expires after a day
+MAX_URL_TEXT_ENTRIES = 500  # Maximum number of cached article texts
+
+_WS_RE = re.compile(r'\s+')
+
+# Last parsed contents per cache file, keyed by (inode, mtime_ns, size)
+_FILE_MEMO: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+# Serializes log appends with compaction in this process (flock does so across processes)
+_log_lock = threading.Lock()
+
+# Requests (hits and verifications) per claim key since this process last compacted
+_HIT_COUNTS: Dict[str, int] = {}
 
 
+@lru_cache(maxsize=512)
 def normalize_claim(text: str) -> str:
     """Normalize claim text for consistent hashing."""
-    return re.sub(r'\s+', ' ', text.strip().lower())
+    return _WS_RE.sub(' ', text.strip().lower())
 
 
+@lru_cache(maxsize=512)
 def claim_hash(text: str) -> str:
-    """Generate SHA256 hash for a news claim."""
+    """Generate a BLAKE2b cache key for a news claim ("b2:" + 32 hex chars)."""
+    normalized = normalize_claim(text)
+    return "b2:" + hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def legacy_claim_hash(text: str) -> str:
+    """SHA256 key used by caches written before claim_hash moved to BLAKE2b."""
     normalized = normalize_claim(text)
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
+def _read_json(path: Path) -> Any:
+    """
+    Parse a JSON cache file, reusing the previous parse while the file is unchanged.
+    Keyed on (inode, mtime_ns, size); callers must copy before mutating the result.
+    """
+    stat = path.stat()
+    stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    memo = _FILE_MEMO.get(path)
+    if memo is not None and memo[0] == stamp:
+        return memo[1]
+    with open(path, "rb") as f:
+        if _HAS_ORJSON and stat.st_size > MMAP_MIN_BYTES:
+            # orjson parses straight from the mapped pages; small files are cheaper to read()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                data = _json_loads(view)
+        else:
+            data = _json_loads(f.read())
+    _FILE_MEMO[path] = (stamp, data)
+    return data
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Atomically replace path with data via a temp file in the same directory."""
+    with tempfile.NamedTemporaryFile(
+        mode="wb", buffering=WRITE_BUFFER_BYTES, dir=path.parent, delete=False
+    ) as tmp:
+        tmp.write(data)
+    try:
+        os.replace(tmp.name, path)
+    except OSError:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def _read_log(path: Path) -> Tuple[Dict[str, Any], int, int]:
+    """
+    Replay an append-only JSONL log of {key: value} lines (later lines win).
+    Returns (entries, line count, bytes consumed); a torn trailing line is skipped.
+    Memoized on (inode, mtime_ns, size) like _read_json.
+    """
+    stat = path.stat()
+    stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    memo = _FILE_MEMO.get(path)
+    if memo is not None and memo[0] == stamp:
+        return memo[1]
+    entries: Dict[str, Any] = {}
+    lines = 0
+    with open(path, "rb") as f:
+        raw = f.read()
+    for line in raw.splitlines():
+        try:
+            entries.update(_json_loads(line))
+            lines += 1
+        except ValueError:
+            continue
+    result = (entries, lines, len(raw))
+    _FILE_MEMO[path] = (stamp, result)
+    return result
+
+
+def _lock_file(f, exclusive: bool) -> None:
+    """flock an open cache file until it is closed (no-op without fcntl)."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+
+def _drop_log_prefix(f, consumed: int) -> None:
+    """Remove the first `consumed` bytes of the exclusively locked log, keeping anything appended after."""
+    f.seek(consumed)
+    tail = f.read()
+    f.seek(0)
+    f.write(tail)
+    f.truncate()
+
+
+def _drop_expired(cache: Dict[str, Any], cutoff: str) -> Dict[str, Any]:
+    """
+    Entries whose timestamp is at or after cutoff ('YYYY-MM-DD HH:MM:SS').
+    Fixed-width timestamps compare as strings; entries use 'YYYY-MM-DD HH:MM:SS'
+    or isoformat(), so normalize the 'T'. Legacy entries without timestamp are kept.
+    """
+    return {
+        key: value for key, value in cache.items()
+        if not isinstance(value, dict)
+        or "timestamp" not in value
+        or str(value["timestamp"]).replace("T", " ", 1) >= cutoff
+    }
+
+
+def _fold_hit_counts(cache: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of cache with pending request counts added to each entry's "hits".
+    Stored counts are halved first so old popularity fades (TinyLFU-style reset).
+    Caller holds _log_lock.
+    """
+    folded = {}
+    for key, value in cache.items():
+        if isinstance(value, dict):
+            value = {**value, "hits": value.get("hits", 0) // 2 + _HIT_COUNTS.get(key, 0)}
+        folded[key] = value
+    _HIT_COUNTS.clear()
+    return folded
+
+
+def _compact_log(cutoff: str) -> None:
+    """
+    Fold the log into CACHE_FILE without expired entries, then drop the folded lines.
+    Holds an exclusive lock on the log throughout, so appends from other processes
+    wait instead of being truncated away, and only one process compacts.
+    """
+    with _log_lock, open(CACHE_LOG_FILE, "r+b") as f:
+        _lock_file(f, exclusive=True)
+        log_entries, log_lines, consumed = _read_log(CACHE_LOG_FILE)
+        if log_lines <= LOG_COMPACT_LINES:
+            return  # Another process compacted first
+        snapshot = _read_json(CACHE_FILE) if CACHE_FILE.exists() else {}
+        live = _drop_expired({**snapshot, **log_entries}, cutoff)
+        if save_verification_cache(_fold_hit_counts(live)):
+            _drop_log_prefix(f, consumed)
+
+
 def load_model_cache() -> Dict[str, Any]:
     """Load cached model information to avoid repeated list_models calls."""
     if not MODEL_CACHE_FILE.exists():
         return {}
     try:
-        with open(MODEL_CACHE_FILE, "r", encoding="utf-8") as f:
-            cache_data = json.load(f)
-            # Check if cache is still valid (24 hour TTL)
-            if cache_data.get("timestamp"):
-                cache_time = datetime.fromisoformat(cache_data["timestamp"])
-                if datetime.now() - cache_time < timedelta(hours=24):
-                    return cache_data
+        cache_data = _read_json(MODEL_CACHE_FILE)
+        # Check if cache is still valid (24 hour TTL)
+        if cache_data.get("timestamp"):
+            cache_time = datetime.fromisoformat(cache_data["timestamp"])
+            if datetime.now() - cache_time < timedelta(hours=24):
+                return dict(cache_data)
         return {}
     except Exception:
         return {}
@@ -56,56 +227,51 @@ def save_model_cache(model_name: str, available_models: List[str]) -> None:
             "available_models": available_models,
             "timestamp": datetime.now().isoformat()
         }
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", dir=CACHE_DIR, delete=False
-        ) as tmp:
-            json.dump(cache_data, tmp, ensure_ascii=False, indent=2)
-            os.replace(tmp.name, MODEL_CACHE_FILE)
+        _atomic_write_bytes(MODEL_CACHE_FILE, _json_dumps(cache_data))
     except Exception:
         pass
 
 
 def load_verification_cache() -> Dict[str, Any]:
     """Load verification cache with TTL filtering."""
-    if not CACHE_FILE.exists():
+    if not CACHE_FILE.exists() and not CACHE_LOG_FILE.exists():
         return {}
     try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
-            cache_data = json.load(f)
-            # Filter expired entries
-            filtered_cache = {}
-            for key, value in cache_data.items():
-                if isinstance(value, dict) and "timestamp" in value:
-                    cache_time = datetime.fromisoformat(value["timestamp"])
-                    if datetime.now() - cache_time < timedelta(days=CACHE_TTL_DAYS):
-                        filtered_cache[key] = value
-                else:
-                    # Legacy entries without timestamp - keep for now
-                    filtered_cache[key] = value
-            return filtered_cache
-    except Exception as e:
-        st.warning(f"Failed to load cache: {e}")
+        cutoff = (datetime.now() - timedelta(days=CACHE_TTL_DAYS)).strftime("%Y-%m-%d %H:%M:%S")
+        cache_data = _read_json(CACHE_FILE) if CACHE_FILE.exists() else {}
+        if CACHE_LOG_FILE.exists():
+            log_entries, log_lines, _ = _read_log(CACHE_LOG_FILE)
+            if log_entries:
+                cache_data = {**cache_data, **log_entries}
+            if log_lines > LOG_COMPACT_LINES:
+                # A failed compaction is retried on a later load; the merged cache is still valid
+                try:
+                    _compact_log(cutoff)
+                except Exception:
+                    logger.debug("Failed to compact verification cache log", exc_info=True)
+        return _drop_expired(cache_data, cutoff)
+    except Exception:
+        logger.debug("Failed to load verification cache", exc_info=True)
         return {}
 
 
-def save_verification_cache(cache: Dict[str, Any]) -> None:
+def save_verification_cache(cache: Dict[str, Any]) -> bool:
     """
     Safely save cache using atomic write to prevent corruption.
-    Enforces size limit and adds timestamps.
+    Enforces size limit and adds timestamps. Returns whether the file was written.
     """
     try:
-        CACHE_DIR.mkdir(exist_ok=True)
-        
         # Add timestamp to new entries and enforce size limit
-        # Keep only the most recent MAX_CACHE_SIZE entries
+        # Keep the MAX_CACHE_SIZE most requested entries, newest first among equals,
+        # so one-off claims don't push out frequently re-checked ones; "hits" decays
+        # at each compaction, so new claims still get in
         if len(cache) > MAX_CACHE_SIZE:
-            # Sort by timestamp (newest first) and keep top MAX_CACHE_SIZE
-            sorted_items = sorted(
+            kept = heapq.nlargest(
+                MAX_CACHE_SIZE,
                 cache.items(),
-                key=lambda x: x[1].get("timestamp", ""),
-                reverse=True
-            )[:MAX_CACHE_SIZE]
-            cache = dict(sorted_items)
+                key=lambda x: (x[1].get("hits", 0), x[1].get("timestamp", ""))
+            )
+            cache = dict(kept)
         
         # Ensure all entries have timestamps
         current_time = datetime.now().isoformat()
@@ -113,32 +279,97 @@ def save_verification_cache(cache: Dict[str, Any]) -> None:
             if isinstance(value, dict) and "timestamp" not in value:
                 value["timestamp"] = current_time
 
+        _atomic_write_bytes(CACHE_FILE, _json_dumps(cache))
+        return True
+
+    except Exception:
+        logger.debug("Failed to save verification cache", exc_info=True)
+        return False
+
+
+def append_verification_entry(key: str, value: Dict[str, Any]) -> None:
+    """
+    Record one verification result by appending a JSON line to the cache log.
+    O(1) per update; load_verification_cache replays and periodically compacts the log.
+    """
+    try:
+        line = _json_dumps({key: value}) + b"\n"
+        with _log_lock:
+            # A (re-)verification counts as a request, so repeated new claims are admitted
+            _HIT_COUNTS[key] = _HIT_COUNTS.get(key, 0) + 1
+            with open(CACHE_LOG_FILE, "ab") as f:
+                # Shared: appends run side by side, but never during compaction
+                _lock_file(f, exclusive=False)
+                f.write(line)
+    except Exception:
+        logger.debug("Failed to append to verification cache log", exc_info=True)
+
+
+def record_verification_hit(key: str) -> None:
+    """
+    Count a cache hit for eviction ranking.
+    Kept in memory and folded into the snapshot at the next compaction; nothing is written.
+    """
+    with _log_lock:
+        _HIT_COUNTS[key] = _HIT_COUNTS.get(key, 0) + 1
+
+
+def _url_text_path(url: str, max_chars: int) -> Path:
+    """Cache file for the text extracted from a URL (blake2b of URL and length cap)."""
+    key = hashlib.blake2b(f"{max_chars}:{url}".encode("utf-8"), digest_size=16).hexdigest()
+    return URL_TEXT_CACHE_DIR / f"{key}.txt"
+
+
+def load_url_text(url: str, max_chars: int) -> str:
+    """
+    Load article text previously extracted from a URL.
+    Shared across processes and restarts; returns "" when missing or expired.
+    """
+    path = _url_text_path(url, max_chars)
+    try:
+        age = datetime.now().timestamp() - path.stat().st_mtime
+        if age >= URL_TEXT_TTL_HOURS * 3600:
+            return ""
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+def save_url_text(url: str, max_chars: int, text: str) -> None:
+    """Persist extracted article text atomically, pruning the oldest entries past the cap."""
+    try:
+        URL_TEXT_CACHE_DIR.mkdir(exist_ok=True)
         with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=CACHE_DIR,
-            delete=False
+            mode="w", encoding="utf-8", dir=URL_TEXT_CACHE_DIR, suffix=".tmp", delete=False
         ) as tmp:
-            json.dump(cache, tmp, ensure_ascii=False, indent=2)
-            temp_name = tmp.name
-
-        # Atomic replace
-        os.replace(temp_name, CACHE_FILE)
+            tmp.write(text)
+        os.replace(tmp.name, _url_text_path(url, max_chars))
 
-    except Exception as e:
-        st.warning(f"Failed to safely save cache: {e}")
+        entries = list(URL_TEXT_CACHE_DIR.glob("*.txt"))
+        if len(entries) > MAX_URL_TEXT_ENTRIES:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for stale in entries[:len(entries) - MAX_URL_TEXT_ENTRIES]:
+                stale.unlink(missing_ok=True)
+    except Exception:
+        pass
 
 
 # Export cache file paths for use in other modules
 __all__ = [
     'load_verification_cache',
     'save_verification_cache',
+    'append_verification_entry',
+    'record_verification_hit',
     'load_model_cache',
     'save_model_cache',
     'claim_hash',
+    'legacy_claim_hash',
     'normalize_claim',
+    'load_url_text',
+    'save_url_text',
     'MODEL_CACHE_FILE',
     'CACHE_FILE',
+    'CACHE_LOG_FILE',
     'CACHE_DIR'
 ]
 
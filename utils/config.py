@@ -1,23 +1,29 @@
 """Configuration settings for Bharat Fact application."""
 
 import os
+from functools import lru_cache
+
 import streamlit as st
 
 
+@lru_cache(maxsize=None)
 def get_api_key(service_name: str) -> str:
     """
-    Safely get API keys from Streamlit secrets or environment variables.
+    Safely get API keys from environment variables or Streamlit secrets.
+    Looked up once per service; a non-empty environment variable takes precedence.
     """
     key_name = f"{service_name}_API_KEY"
 
-    # 1 Try Streamlit secrets
+    # 1 Environment variable (plain dict lookup)
+    env_value = os.getenv(key_name)
+    if env_value:
+        return env_value
+
+    # 2 Fallback to Streamlit secrets
     try:
         return st.secrets[key_name]
     except Exception:
-        pass
-
-    # 2 Fallback to environment variable
-    return os.getenv(key_name, "")
+        return ""
 
 
 class EnhancedAppConfig:
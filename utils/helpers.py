@@ -2,11 +2,38 @@
 
 import json
 import re
-import time
+from functools import lru_cache
+
 import requests
-from requests.exceptions import RequestException, Timeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 import streamlit as st
 
+_DECODER = json.JSONDecoder()
+_JSON_START_RE = re.compile(r'[\[{]')
+_UNSAFE_RE = re.compile(r'[^\w\s-]')
+_WS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=8)
+def _session(retries: int, backoff_factor: float) -> requests.Session:
+    """Pooled keep-alive session whose adapter retries connection errors and 5xx responses."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=max(retries - 1, 0),
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def safe_requests_get(
     url: str,
@@ -17,26 +44,17 @@ def safe_requests_get(
 ):
     """
     Robust HTTP GET with retries and exponential backoff.
-    Backoff pattern: 1s → 2s → 4s
+    Up to `retries` attempts over a shared connection pool; urllib3 handles the backoff.
     """
     headers = headers or {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64)'}
 
-    for attempt in range(retries):
-        try:
-            resp = requests.get(url, headers=headers, timeout=timeout)
-
-            # Retry on server-side errors
-            if resp.status_code >= 500:
-                raise RequestException(f"Server error: {resp.status_code}")
-
-            resp.raise_for_status()
-            return resp
-
-        except (RequestException, Timeout) as e:
-            if attempt == retries - 1:
-                st.warning(f"Request failed: {e}")
-                return None
-            time.sleep(backoff_factor * (2 ** attempt))
+    try:
+        resp = _session(retries, backoff_factor).get(url, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        return resp
+    except RequestException as e:
+        st.warning(f"Request failed: {e}")
+        return None
 
 
 def extract_first_json(text: str):
@@ -48,19 +66,20 @@ def extract_first_json(text: str):
 
     text = text.strip()
 
-    # Try to find JSON object or array start positions
-    starts = []
-    for i, ch in enumerate(text):
-        if ch == '{' or ch == '[':
-            starts.append(i)
+    # Common case: the whole response is a single JSON object/array
+    if text.startswith(('{', '[')):
+        try:
+            return json.loads(text)
+        except (ValueError, RecursionError):
+            pass
 
-    for start in starts:
-        for end in range(start + 1, len(text) + 1):
-            try:
-                candidate = text[start:end]
-                return json.loads(candidate)
-            except Exception:
-                continue
+    # raw_decode parses one value from each candidate start in a single pass
+    for match in _JSON_START_RE.finditer(text):
+        try:
+            obj, _ = _DECODER.raw_decode(text, match.start())
+            return obj
+        except (ValueError, RecursionError):
+            continue
 
     return None
 
@@ -69,7 +88,7 @@ def safe_filename(s: str, maxlen: int = 50) -> str:
     """Generate a safe filename from a string."""
     if not s:
         return "fact_check"
-    s = re.sub(r'[^\w\s-]', '', s)
-    s = re.sub(r'\s+', '_', s).strip('_')
+    s = _UNSAFE_RE.sub('', s)
+    s = _WS_RE.sub('_', s).strip('_')
     return s[:maxlen] or "fact_check"
 